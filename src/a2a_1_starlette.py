@@ -1,9 +1,15 @@
+import contextlib
+import os
 import uvicorn
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
 from a2a_2_executor import LangGraphAgentExecutor #invoke a2a Executor
+from event_log import ReplayRequestHandler, TaskEventLog
+from push_notifications import FilePushNotificationConfigStore, QueuedPushNotificationSender
 import logging
 
 
@@ -61,17 +67,40 @@ def main():
         
     )
 
-    request_handler = DefaultRequestHandler(
-        agent_executor=LangGraphAgentExecutor(),
+    # streamed events are kept per task so tasks/resubscribe can resume from an offset;
+    # set A2A_EVENT_LOG_DIR to also keep them on disk across restarts
+    event_log = TaskEventLog(directory=os.environ.get("A2A_EVENT_LOG_DIR"))
+    agent_executor = LangGraphAgentExecutor(event_log=event_log)
+    # webhooks registered via pushNotificationConfig survive restarts in this JSON file
+    push_config_store = FilePushNotificationConfigStore(os.environ.get("A2A_PUSH_CONFIG_PATH", "push_configs.json"))
+    push_sender = QueuedPushNotificationSender(push_config_store)
+    request_handler = ReplayRequestHandler(
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
+        push_config_store=push_config_store,
+        push_sender=push_sender,
+        event_log=event_log,
     )
 
+    # liveness answers as soon as the port is bound; "agent_ready" flips once the
+    # LangGraph/Ollama stack has finished loading in the background
+    async def health(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "ok", "agent_ready": agent_executor.ready})
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        agent_executor.start_warmup()
+        await push_sender.start()
+        yield
+        await push_sender.stop()
+
     server = A2AStarletteApplication(
         http_handler=request_handler,
         agent_card=agent_card,
     )
 
-    uvicorn.run(server.build(), host="0.0.0.0", port=9998)
+    app = server.build(routes=[Route("/health", health)], lifespan=lifespan)
+    uvicorn.run(app, host="0.0.0.0", port=9998)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import asyncio
+import importlib
 import logging
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
@@ -11,11 +13,12 @@ from a2a.types import (
     UnsupportedOperationError,
 )
 from a2a.utils.errors import ServerError
-from a2a_3_agent import langG_agent #import the actual agent class (langGraph)
+from event_log import LoggedEventQueue, TaskEventLog
 """
 This is the executor class which is wrapped by the startlette app/server. It call imports
 the actual agent class from LangGraph (or similar). It always needs to:
-1) Initialise the agent
+1) Initialise the agent (lazily: a2a_3_agent pulls in langchain/langgraph/ollama, which is
+   slow, so it is imported in a background thread once the server is already serving)
 2) Have an *execute* function which is called every time there's a request from the agent
 3) A *cancel* function to calcel/stop a task based on an ID,
 """
@@ -27,8 +30,30 @@ logger = logging.getLogger(__name__)
 
 class LangGraphAgentExecutor(AgentExecutor):
     """Langraph simple agent executor"""
-    def __init__(self):
-        self.agent = langG_agent()
+    def __init__(self, event_log: TaskEventLog | None = None):
+        self.agent = None
+        self.event_log = event_log
+        self._warmup: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the LangGraph agent has been imported and built."""
+        return self.agent is not None
+
+    def start_warmup(self) -> asyncio.Task:
+        """Start loading the agent in the background (idempotent)."""
+        failed = self._warmup is not None and self._warmup.done() and (
+            self._warmup.cancelled() or self._warmup.exception() is not None
+        )
+        if self._warmup is None or failed:
+            self._warmup = asyncio.create_task(self._load_agent())
+        return self._warmup
+
+    async def _load_agent(self) -> None:
+        # heavy imports run off the event loop so the card/health routes stay responsive
+        module = await asyncio.to_thread(importlib.import_module, "a2a_3_agent")
+        self.agent = module.langG_agent()
+        logger.info("LangGraph agent loaded")
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         ### managing inputs
@@ -36,7 +61,9 @@ class LangGraphAgentExecutor(AgentExecutor):
             raise ValueError("RequestContext must have task_id and context_id")
         if not context.message:
             raise ValueError("RequestContext must have a message")
-        ### update the tasks for the agent
+        ### update the tasks for the agent (recording events for resubscribe replay)
+        if self.event_log is not None:
+            event_queue = LoggedEventQueue(event_queue, context.task_id, self.event_log)
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
         if not context.current_task:
             await updater.submit()
@@ -44,6 +71,8 @@ class LangGraphAgentExecutor(AgentExecutor):
         ### using the input generate a query for the agent
         query = context.get_user_input()
         try:
+            # shielded: a cancelled request must not cancel the warm-up shared by the others
+            await asyncio.shield(self.start_warmup())
             async for item in self.agent.stream(query, context.context_id):
                 is_task_complete = item["is_task_complete"]
                 require_user_input = item["require_user_input"]
@@ -71,6 +100,9 @@ class LangGraphAgentExecutor(AgentExecutor):
         except Exception as e:
             logger.error(f"An error occurred while streaming the response: {e}")
             raise ServerError(error=InternalError()) from e
+        finally:
+            if self.event_log is not None:
+                self.event_log.close(context.task_id)
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
         raise ServerError(error=UnsupportedOperationError())
\ No newline at end of file
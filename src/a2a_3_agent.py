@@ -7,8 +7,12 @@ from typing import Any, List, Literal
 from pydantic import BaseModel
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
 from collections.abc import AsyncIterable
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from tool_schemas import render_tool_result
+from tool_prefetch import PrefetchCallbackHandler, ToolPrefetcher, current_prefetcher
+from record_replay import Cassette, CassetteChatOllama
 
 os.environ["NO_PROXY"] = "127.0.0.1,localhost"
 
@@ -33,9 +37,19 @@ class langG_agent:
         """
     )
 
-    def __init__(self):
-        self.model = ChatOllama(model="mistral-nemo", temperature=0)
+    def __init__(self, speculative_tools: bool | None = None, cassette: Cassette | None = None):
+        # record/replay Ollama and MCP traffic (AGENT_CASSETTE, see record_replay.py)
+        self.cassette = cassette or Cassette.from_env()
+        if self.cassette:
+            self.model = CassetteChatOllama(model="mistral-nemo", temperature=0, cassette=self.cassette)
+        else:
+            self.model = ChatOllama(model="mistral-nemo", temperature=0)
         self.tools = None
+        self._mcp_tools = {}
+        # start tool calls while the model is still streaming them (AGENT_SPECULATIVE_TOOLS=1)
+        if speculative_tools is None:
+            speculative_tools = os.environ.get("AGENT_SPECULATIVE_TOOLS", "").lower() in ("1", "true", "yes")
+        self.speculative_tools = speculative_tools
         self.graph = None
         self._initialized = False
 
@@ -66,13 +80,22 @@ class langG_agent:
     async def stream(self, query, context_id) -> AsyncIterable[dict[str, Any]]:
         """Token-by-token streaming using astream_events."""
         await self._initialize()
+        if self.cassette:
+            self.cassette.record_query(query)
         inputs = {"messages": [("user", query)]}
         config: RunnableConfig = {"configurable": {"thread_id": context_id}}
 
         current_tool = None
+        prefetcher = None
+        run_config = config
+        if self.speculative_tools:
+            prefetcher = ToolPrefetcher({name: tool.ainvoke for name, tool in self._mcp_tools.items()})
+            # observed from inside the model run, so it never lags behind the tool node
+            run_config = {**config, "callbacks": [PrefetchCallbackHandler(prefetcher)]}
+        current_prefetcher.set(prefetcher)
         
         try:
-            async for event in self.graph.astream_events(inputs, config, version="v2"):
+            async for event in self.graph.astream_events(inputs, run_config, version="v2"):
                 kind = event["event"]
                 
                 # Stream individual LLM tokens
@@ -127,6 +150,11 @@ class langG_agent:
                 "require_user_input": False,
                 "content": f"❌ Streaming error: {str(e)}",
             }
+        finally:
+            if prefetcher:
+                prefetcher.discard()
+                logger.info(f"Speculative tool calls: {prefetcher.hits} used, {prefetcher.wasted} discarded")
+            current_prefetcher.set(None)
     
     def get_agent_response(self, config):
         current_state = self.graph.get_state(config)
@@ -162,6 +190,11 @@ class langG_agent:
     
     async def _get_mcp_tools(self):
         """Get tools from MCP server."""
+        if self.cassette and self.cassette.replaying:
+            tools = self.cassette.replay_tools()
+            self._mcp_tools = {tool.name: tool for tool in tools}
+            return [self._render_results(tool) for tool in tools]
+
         mcp_client = MultiServerMCPClient(
             {
                 "research": {
@@ -173,4 +206,25 @@ class langG_agent:
 
         tools = await mcp_client.get_tools()
         print("\n🔧 Available Tools:", [tool.name for tool in tools])
-        return tools
\ No newline at end of file
+        if self.cassette:
+            tools = self.cassette.record_tools(tools)
+        self._mcp_tools = {tool.name: tool for tool in tools}
+        return [self._render_results(tool) for tool in tools]
+
+    @staticmethod
+    def _render_results(tool: BaseTool) -> BaseTool:
+        """Wrap an MCP tool so its structured result is rendered to text for the LLM."""
+        async def call_tool(**arguments):
+            # reuse the speculative call started while the model was streaming, if any
+            prefetcher = current_prefetcher.get()
+            prefetched = prefetcher.take(tool.name, arguments) if prefetcher else None
+            # no callbacks: the MCP call must not be traced as a second tool run inside this one
+            content = await prefetched if prefetched else await tool.ainvoke(arguments, config={"callbacks": []})
+            return render_tool_result(tool.name, content)
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            coroutine=call_tool,
+        )
\ No newline at end of file
@@ -1,18 +1,22 @@
+import os
 import uuid
 import asyncio
 import httpx
 from a2a.client.client_factory import ClientFactory
 from a2a.client.client import ClientConfig
-from a2a.client import A2ACardResolver
+from a2a.client import A2ACardResolver, A2AClientHTTPError
 from a2a.types import (
     AgentCard,
     Message,
     Part,
+    PushNotificationConfig,
     Role,
+    TaskIdParams,
     TextPart,
 )
 
 BASE_URL = "http://localhost:9998"
+MAX_RESUME_ATTEMPTS = 3  # tasks/resubscribe retries after the stream drops
 
 # Set timeout values
 timeout_config = httpx.Timeout(
@@ -57,7 +61,15 @@ async def main() -> None:
             raise RuntimeError("Failed to connect to agent")
         
         # Initialize the A2A client
-        config = ClientConfig(httpx_client=httpx_client)
+        # optionally ask the agent to also push task updates to a webhook
+        # (e.g. A2A_PUSH_WEBHOOK=http://localhost:9999/notify with src/webhook_receiver.py)
+        push_configs = []
+        if os.environ.get("A2A_PUSH_WEBHOOK"):
+            push_configs.append(PushNotificationConfig(
+                url=os.environ["A2A_PUSH_WEBHOOK"],
+                token=os.environ.get("A2A_PUSH_TOKEN"),
+            ))
+        config = ClientConfig(httpx_client=httpx_client, push_notification_configs=push_configs)
         factory = ClientFactory(config)
         client = factory.create(final_agent_card_to_use)
 
@@ -96,18 +108,36 @@ async def main() -> None:
                     
                     seen_content = set()
                     has_content = False
+                    # the server stamps every event with metadata["seq"]; on a dropped
+                    # connection we resubscribe from the last one instead of resending
+                    task_id = None
+                    last_seq = 0
                     
-                    async for task, event in response:
-                        status = event.status
-                        if status and status.message:
-                            for part in status.message.parts:
-                                if isinstance(part.root, TextPart):
-                                    content = part.root.text
-                                    
-                                    if content not in seen_content:
-                                        print(content, end="", flush=True)  # ✅ Just this
-                                        seen_content.add(content)
-                                        has_content = True
+                    for attempt in range(MAX_RESUME_ATTEMPTS + 1):
+                        try:
+                            async for task, event in response:
+                                task_id = task.id
+                                if event is not None and event.metadata:
+                                    last_seq = event.metadata.get("seq", last_seq)
+                                status = event.status
+                                if status and status.message:
+                                    for part in status.message.parts:
+                                        if isinstance(part.root, TextPart):
+                                            content = part.root.text
+                                            
+                                            if content not in seen_content:
+                                                print(content, end="", flush=True)  # ✅ Just this
+                                                seen_content.add(content)
+                                                has_content = True
+                            break
+                        except A2AClientHTTPError as e:
+                            if e.status_code != 503 or not task_id or attempt == MAX_RESUME_ATTEMPTS:
+                                raise
+                            print(f"\n🔌 Connection lost, resuming after event {last_seq}...", flush=True)
+                            await asyncio.sleep(2 ** attempt)
+                            response = client.resubscribe(
+                                TaskIdParams(id=task_id, metadata={"last_seq": last_seq})
+                            )
                     
                     if has_content:
                         print("\n")  # Only ONE newline at the very end
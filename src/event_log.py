@@ -0,0 +1,215 @@
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from a2a.server.context import ServerCallContext
+from a2a.server.events.event_queue import Event, EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import InvalidParamsError, TaskArtifactUpdateEvent, TaskIdParams, TaskStatusUpdateEvent
+from a2a.utils.errors import ServerError
+"""
+Replay log for streamed task events. Every status/artifact event the executor publishes is
+stamped with a sequence number (event.metadata["seq"]) and kept in a per-task ring buffer,
+optionally mirrored to an append-only JSONL file per task. A client that drops off
+`message/stream` calls `tasks/resubscribe` with metadata {"last_seq": N} and gets every
+event after N, followed by the live tail, without the agent regenerating anything.
+"""
+
+logger = logging.getLogger(__name__)
+
+SEQ_KEY = "seq"
+UpdateEvent = TaskStatusUpdateEvent | TaskArtifactUpdateEvent
+_EVENT_TYPES = {
+    "status-update": TaskStatusUpdateEvent,
+    "artifact-update": TaskArtifactUpdateEvent,
+}
+
+
+@dataclass
+class _TaskLog:
+    events: deque
+    next_seq: int = 1
+    closed: bool = False
+    # replaced on every append so followers can wait for "anything newer than what I saw"
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    file: Any = None
+
+
+class TaskEventLog:
+    """Sequence-numbered event log per task, bounded in memory and optionally on disk.
+
+    At most `max_tasks` finished tasks are retained; when one is evicted its file is deleted
+    too, and on startup only the `max_tasks` most recent files in `directory` are kept.
+    """
+
+    def __init__(self, capacity: int = 1024, directory: str | None = None, max_tasks: int = 256):
+        self.capacity = capacity
+        self.directory = directory
+        self.max_tasks = max_tasks
+        self._tasks: OrderedDict[str, _TaskLog] = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._prune_directory()
+
+    def has(self, task_id: str) -> bool:
+        path = self._path(task_id)
+        return task_id in self._tasks or (path is not None and os.path.exists(path))
+
+    def append(self, task_id: str, event: UpdateEvent) -> UpdateEvent:
+        """Stamp `event` with the next sequence number and record it."""
+        log = self._get(task_id, create=True)
+        seq = log.next_seq
+        log.next_seq += 1
+        log.closed = False
+        event.metadata = {**(event.metadata or {}), SEQ_KEY: seq}
+        log.events.append((seq, event))
+
+        path = self._path(task_id)
+        if path is not None:
+            if log.file is None:
+                log.file = open(path, "a", encoding="utf-8")
+            # small line-buffered writes; cheap enough to do inline on the event loop
+            log.file.write(event.model_dump_json(exclude_none=True) + "\n")
+            log.file.flush()
+
+        log.changed.set()
+        log.changed = asyncio.Event()
+        return event
+
+    def close(self, task_id: str) -> None:
+        """Mark the producer as finished so followers stop waiting for more events."""
+        log = self._tasks.get(task_id)
+        if log is None:
+            return
+        log.closed = True
+        if log.file is not None:
+            log.file.close()
+            log.file = None
+        log.changed.set()
+        self._evict()
+
+    async def follow(self, task_id: str, after: int = 0) -> AsyncIterator[UpdateEvent]:
+        """Yield every event with seq > `after`, then the live tail until the task closes."""
+        log = self._get(task_id)
+        if log is None:
+            return
+        while True:
+            changed = log.changed
+            if log.events and log.events[0][0] > after + 1:
+                # the ring buffer already dropped part of what this follower needs
+                for seq, event in self._read_file(task_id):
+                    if after < seq < log.events[0][0]:
+                        yield event
+                        after = seq
+                if log.events[0][0] > after + 1:
+                    logger.warning(f"Replay gap for task {task_id}: events {after + 1}-{log.events[0][0] - 1} lost")
+            for seq, event in list(log.events):
+                if seq > after:
+                    yield event
+                    after = seq
+            if log.closed and after >= log.next_seq - 1:
+                return
+            await changed.wait()
+
+    def _get(self, task_id: str, create: bool = False) -> _TaskLog | None:
+        log = self._tasks.get(task_id)
+        if log is None:
+            # after a restart (or eviction) the on-disk log is the source of truth
+            events = self._read_file(task_id)
+            if not events and not create:
+                return None
+            log = _TaskLog(events=deque(events, maxlen=self.capacity), closed=True)
+            log.next_seq = events[-1][0] + 1 if events else 1
+            self._tasks[task_id] = log
+        self._tasks.move_to_end(task_id)
+        # never evict the log being handed out, even when everything else is still running
+        self._evict(keep=task_id)
+        return log
+
+    def _evict(self, keep: str | None = None) -> None:
+        # forget the least recently used finished tasks; running ones are never dropped
+        for task_id in list(self._tasks):
+            if len(self._tasks) <= self.max_tasks:
+                break
+            if self._tasks[task_id].closed and task_id != keep:
+                del self._tasks[task_id]
+                self._remove_file(task_id)
+
+    def _prune_directory(self) -> None:
+        # logs left by a previous run: keep the newest max_tasks, like the in-memory LRU
+        paths = [entry.path for entry in os.scandir(self.directory) if entry.name.endswith(".jsonl")]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[self.max_tasks:]:
+            os.remove(path)
+
+    def _remove_file(self, task_id: str) -> None:
+        path = self._path(task_id)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def _path(self, task_id: str) -> str | None:
+        if not self.directory or not task_id or os.path.basename(task_id) != task_id or task_id.startswith("."):
+            return None
+        return os.path.join(self.directory, f"{task_id}.jsonl")
+
+    def _read_file(self, task_id: str) -> list[tuple[int, UpdateEvent]]:
+        path = self._path(task_id)
+        if path is None or not os.path.exists(path):
+            return []
+        events = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    event = _EVENT_TYPES[data["kind"]].model_validate(data)
+                except (ValueError, KeyError) as e:
+                    # a torn last line from a crash mid-write is expected; skip it
+                    logger.warning(f"Skipping unreadable event in {path}: {e}")
+                    continue
+                events.append((event.metadata[SEQ_KEY], event))
+        return events
+
+
+class LoggedEventQueue:
+    """Wraps an EventQueue so everything a TaskUpdater publishes also lands in the log."""
+
+    def __init__(self, queue: EventQueue, task_id: str, event_log: TaskEventLog):
+        self.queue = queue
+        self.task_id = task_id
+        self.event_log = event_log
+
+    async def enqueue_event(self, event: Event) -> None:
+        if isinstance(event, UpdateEvent):
+            event = self.event_log.append(self.task_id, event)
+        await self.queue.enqueue_event(event)
+
+
+class ReplayRequestHandler(DefaultRequestHandler):
+    """DefaultRequestHandler whose `tasks/resubscribe` replays from the event log."""
+
+    def __init__(self, *args, event_log: TaskEventLog, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.event_log = event_log
+
+    async def on_resubscribe_to_task(
+        self,
+        params: TaskIdParams,
+        context: ServerCallContext | None = None,
+    ) -> AsyncIterator[Event]:
+        if not self.event_log.has(params.id):
+            async for event in super().on_resubscribe_to_task(params, context):
+                yield event
+            return
+
+        try:
+            after = int((params.metadata or {}).get("last_seq", 0))
+        except (TypeError, ValueError):
+            raise ServerError(error=InvalidParamsError(message="metadata.last_seq must be an integer"))
+
+        async for event in self.event_log.follow(params.id, after):
+            yield event
@@ -1,26 +1,42 @@
 import asyncio
-from functools import partial
+import importlib
+import re
+import threading
 from mcp.server.fastmcp import FastMCP
-from langchain_community.utilities.duckduckgo_search import DuckDuckGoSearchAPIWrapper
-import wikipedia
+from tool_schemas import Paper, PaperSearchResults, WebResult, WebSearchResults, WikiPage
 import logging
 import signal
 import sys
 import atexit
 import os
-from ddgs import DDGS  
-import arxiv
 
 os.environ["PORT"] = "8000"
 
 logging.basicConfig(level=logging.INFO)
 
+# The search backends (ddgs, wikipedia, arxiv) are imported lazily inside the worker
+# threads so the server binds its port without paying for them up front.
+TOOL_BACKENDS = ("ddgs", "wikipedia", "arxiv")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def preload_tool_backends():
+    """Import the search backends in a background thread after startup."""
+    def _preload():
+        for name in TOOL_BACKENDS:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                logging.warning(f"⚠️ Could not preload {name}: {str(e)}")
+        logging.info("📦 Search backends loaded")
+
+    threading.Thread(target=_preload, name="preload-tool-backends", daemon=True).start()
+
 # Initialize FastMCP server with a service name
 mcp = FastMCP("ResearchTools")
 
 # DuckDuckGo search tool -- running async with a loop executor
 @mcp.tool()
-async def duckduckgo_search(query: str) -> str:
+async def duckduckgo_search(query: str) -> WebSearchResults:
     """Search the web using DuckDuckGo."""
     logging.info(f" ****  🔧 🔧 🔧 Called duckduckgo_search with: {query}")
     try:
@@ -29,46 +45,50 @@ async def duckduckgo_search(query: str) -> str:
         
         def _search():
             try:
+                from ddgs import DDGS
                 # Use DDGS directly
                 with DDGS() as ddgs:
-                    results = list(ddgs.text(query, max_results=5))
-                    if results:
-                        formatted = []
-                        for r in results:
-                            formatted.append(
-                                f"**{r['title']}**\n"
-                                f"{r['body']}\n"
-                                f"Source: {r['href']}\n"
-                            )
-                        return "\n".join(formatted)
-                    return "No results found."
+                    results = ddgs.text(query, max_results=5)
+                    return WebSearchResults(
+                        query=query,
+                        results=[WebResult(title=r['title'], snippet=r['body'], url=r['href']) for r in results],
+                    )
             except Exception as e:
                 logging.error(f"DuckDuckGo search error: {str(e)}")
-                return f"Search error: {str(e)}"
+                return WebSearchResults(query=query, error=str(e))
         
         results = await loop.run_in_executor(None, _search)
         return results
         
     except Exception as e:
         logging.error(f"Error occurred in duckduckgo_search: {str(e)}")
-        return f"Error: {str(e)}"
+        return WebSearchResults(query=query, error=str(e))
 
 # Wikipedia search tool -- running async with a loop executor
 @mcp.tool()
-async def wikipedia_search(query: str) -> str:
+async def wikipedia_search(query: str) -> WikiPage:
     """Search Wikipedia for factual information."""
     logging.info(f" *****  🔧 🔧 🔧 Called wikipedia_search with: {query}")
     try:
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, partial(wikipedia.summary, query, sentences=3))
+
+        def _summary():
+            import wikipedia
+            # one page lookup gives the canonical title and URL; page.summary is the intro,
+            # trimmed here to 3 sentences (same request count as wikipedia.summary)
+            page = wikipedia.page(query)
+            summary = " ".join(SENTENCE_END.split(page.summary.strip())[:3])
+            return WikiPage(query=query, title=page.title, summary=summary, url=page.url)
+
+        result = await loop.run_in_executor(None, _summary)
         return result
     except Exception as e:
         logging.error(f"Error occurred in wikipedia_search: {str(e)}")
-        return f"Error: {str(e)}"
+        return WikiPage(query=query, error=str(e))
 
 # arXiv search tool -- running async with a loop executor
 @mcp.tool()
-async def arxiv_search(query: str, max_results: int = 5) -> str:
+async def arxiv_search(query: str, max_results: int = 5) -> PaperSearchResults:
     """Search arXiv for academic papers and research articles.
     
     Args:
@@ -81,6 +101,7 @@ async def arxiv_search(query: str, max_results: int = 5) -> str:
         
         def _search():
             try:
+                import arxiv
                 # Create arXiv client and search
                 client = arxiv.Client()
                 search = arxiv.Search(
@@ -94,40 +115,35 @@ async def arxiv_search(query: str, max_results: int = 5) -> str:
                 
                 logging.info(f"📊 Retrieved {len(results)} results from arXiv")
                 
-                if results:
-                    formatted = []
-                    for paper in results:
-                        # Format each paper
-                        authors = ", ".join([author.name for author in paper.authors[:3]])
-                        if len(paper.authors) > 3:
-                            authors += " et al."
-                        
-                        formatted.append(
-                            f"**{paper.title}**\n"
-                            f"Authors: {authors}\n"
-                            f"Published: {paper.published.strftime('%Y-%m-%d')}\n"
-                            f"Summary: {paper.summary[:300]}...\n"
-                            f"PDF: {paper.pdf_url}\n"
-                            f"arXiv ID: {paper.entry_id}\n"
-                        )
-                    
-                    final_result = "\n---\n".join(formatted)
-                    logging.info(f"✅ Returning {len(formatted)} formatted papers")
-                    return final_result
+                if not results:
+                    logging.warning("⚠️ No results found from arXiv")
                 
-                logging.warning("⚠️ No results found from arXiv")
-                return "No papers found."
+                # Keep each record compact: first three authors and a trimmed summary
+                papers = [
+                    Paper(
+                        title=paper.title,
+                        authors=[author.name for author in paper.authors[:3]],
+                        et_al=len(paper.authors) > 3,
+                        published=paper.published.strftime('%Y-%m-%d'),
+                        summary=paper.summary[:300],
+                        pdf_url=paper.pdf_url,
+                        entry_id=paper.entry_id,
+                    )
+                    for paper in results
+                ]
+                logging.info(f"✅ Returning {len(papers)} papers")
+                return PaperSearchResults(query=query, papers=papers)
                 
             except Exception as e:
                 logging.error(f"❌ arXiv search error: {str(e)}")
-                return f"Search error: {str(e)}"
+                return PaperSearchResults(query=query, error=str(e))
         
         results = await loop.run_in_executor(None, _search)
         return results
         
     except Exception as e:
         logging.error(f"❌ Error occurred in arxiv_search: {str(e)}")
-        return f"Error: {str(e)}"
+        return PaperSearchResults(query=query, error=str(e))
 
 
 # Graceful shutdown handlers
@@ -160,6 +176,7 @@ def setup_signal_handlers():
 if __name__ == "__main__":
     try:
         setup_signal_handlers()
+        preload_tool_backends()
         logging.info("🚀 Starting MCP Research Tools server...")
         logging.info("📡 Server running on streamable-http transport")
         logging.info("🔍 Available tools: duckduckgo_search, wikipedia_search")
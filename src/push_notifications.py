@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+import os
+import random
+
+import httpx
+from a2a.server.tasks import PushNotificationConfigStore, PushNotificationSender
+from a2a.types import PushNotificationConfig, Task, TaskState
+"""
+Push-notification delivery for long-running tasks. DefaultRequestHandler calls
+`send_notification` after every event (i.e. every streamed token), so the sender only records
+the latest task state and wakes a worker; a burst of updates for one task collapses into a
+single POST of the newest state. Workers share one pooled httpx client and retry failed
+deliveries with exponential backoff. Webhook configs are persisted to a JSON file; a task's
+configs are dropped once it stops (finished or waiting for input) and that state has been sent.
+The file is also capped at the `max_tasks` most recently registered tasks, which clears out
+tasks left over from a previous run (the in-memory task store has forgotten them).
+"""
+
+logger = logging.getLogger(__name__)
+
+# states after which the executor publishes nothing more for the task; input_required ends the
+# turn too, and the client registers its config again with the next message
+STOPPED_STATES = {
+    TaskState.completed,
+    TaskState.failed,
+    TaskState.canceled,
+    TaskState.rejected,
+    TaskState.input_required,
+}
+
+
+class FilePushNotificationConfigStore(PushNotificationConfigStore):
+    """Push configs per task, kept in memory and mirrored to a JSON file.
+
+    Only the `max_tasks` most recently registered tasks are kept, on load and on every write.
+    """
+
+    def __init__(self, path: str, max_tasks: int = 256):
+        self.path = path
+        self.max_tasks = max_tasks
+        self.lock = asyncio.Lock()
+        self._configs: dict[str, list[PushNotificationConfig]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for task_id, configs in json.load(f).items():
+                    self._configs[task_id] = [PushNotificationConfig.model_validate(c) for c in configs]
+            self._trim()
+
+    async def set_info(self, task_id: str, notification_config: PushNotificationConfig) -> None:
+        async with self.lock:
+            if notification_config.id is None:
+                notification_config.id = task_id
+            configs = [c for c in self._configs.get(task_id, []) if c.id != notification_config.id]
+            configs.append(notification_config)
+            self._configs.pop(task_id, None)  # re-insert so the dict stays in registration order
+            self._configs[task_id] = configs
+            self._trim()
+            await self._save()
+
+    async def get_info(self, task_id: str) -> list[PushNotificationConfig]:
+        return list(self._configs.get(task_id, []))
+
+    async def delete_info(self, task_id: str, config_id: str | None = None) -> None:
+        async with self.lock:
+            config_id = config_id or task_id
+            configs = [c for c in self._configs.get(task_id, []) if c.id != config_id]
+            if configs:
+                self._configs[task_id] = configs
+            else:
+                self._configs.pop(task_id, None)
+            await self._save()
+
+    def _trim(self) -> None:
+        # the oldest registrations go first; a task that old is finished or was lost in a restart
+        for task_id in list(self._configs)[: max(len(self._configs) - self.max_tasks, 0)]:
+            del self._configs[task_id]
+
+    async def _save(self) -> None:
+        data = {
+            task_id: [c.model_dump(mode="json", exclude_none=True) for c in configs]
+            for task_id, configs in self._configs.items()
+        }
+        await asyncio.to_thread(self._write, data)
+
+    def _write(self, data: dict) -> None:
+        # write-then-rename so a crash never leaves a half-written store behind
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class QueuedPushNotificationSender(PushNotificationSender):
+    """Coalescing, retrying push sender backed by a pool of async workers."""
+
+    def __init__(
+        self,
+        config_store: PushNotificationConfigStore,
+        workers: int = 4,
+        max_retries: int = 4,
+        backoff: float = 0.5,
+        coalesce_delay: float = 0.25,
+        timeout: float = 10.0,
+    ):
+        self.config_store = config_store
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.coalesce_delay = coalesce_delay
+        self.timeout = timeout
+        self._latest: dict[str, Task] = {}  # newest undelivered state per task
+        self._active: set[str] = set()  # task ids a worker is currently handling
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._client: httpx.AsyncClient | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.workers * 2, max_keepalive_connections=self.workers),
+        )
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Deliver what is queued (up to `drain_timeout`), then shut the workers down."""
+        try:
+            await asyncio.wait_for(self._queue.join(), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping undelivered push notifications for {len(self._latest)} task(s)")
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def send_notification(self, task: Task) -> None:
+        if not await self.config_store.get_info(task.id):
+            return
+        # the Task object is the live one kept by the task manager; it is serialized at
+        # delivery time, so whichever worker picks it up sends the newest state
+        pending = task.id in self._latest or task.id in self._active
+        self._latest[task.id] = task
+        if not pending:
+            self._queue.put_nowait(task.id)
+
+    async def _worker(self) -> None:
+        while True:
+            task_id = await self._queue.get()
+            self._active.add(task_id)
+            try:
+                await asyncio.sleep(self.coalesce_delay)
+                # updates that arrived while we were sending are delivered by this same worker,
+                # which keeps notifications for one task in order
+                while task_id in self._latest:
+                    state = await self._deliver(self._latest.pop(task_id))
+                    if state in STOPPED_STATES:
+                        await self._forget(task_id)
+            except Exception:
+                logger.exception(f"Push delivery failed for task_id={task_id}")
+            finally:
+                self._active.discard(task_id)
+                self._queue.task_done()
+
+    async def _deliver(self, task: Task) -> TaskState:
+        """POST the task to every webhook; returns the state that was sent."""
+        configs = await self.config_store.get_info(task.id)
+        # the live task may move on while we post, so report the state in this payload
+        payload = task.model_dump(mode="json", exclude_none=True)
+        await asyncio.gather(*(self._post(task.id, config, payload) for config in configs))
+        return TaskState(payload["status"]["state"])
+
+    async def _forget(self, task_id: str) -> None:
+        # nothing more is published until the client sends another message, which registers the
+        # config again; failed deliveries are not retried later either
+        for config in await self.config_store.get_info(task_id):
+            await self.config_store.delete_info(task_id, config.id)
+
+    async def _post(self, task_id: str, config: PushNotificationConfig, payload: dict) -> bool:
+        headers = {"X-A2A-Notification-Token": config.token} if config.token else None
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.post(config.url, json=payload, headers=headers)
+                if response.is_success:
+                    logger.info(f"Push-notification sent for task_id={task_id} to {config.url}")
+                    return True
+                # client errors won't fix themselves, except rate limiting / timeouts
+                if response.is_client_error and response.status_code not in (408, 429):
+                    logger.error(f"Webhook {config.url} rejected task_id={task_id}: HTTP {response.status_code}")
+                    return False
+                error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                error = str(e) or type(e).__name__
+            if attempt < self.max_retries:
+                delay = self.backoff * 2 ** attempt + random.uniform(0, self.backoff)
+                logger.warning(f"Push to {config.url} failed ({error}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        logger.error(f"Giving up on push to {config.url} for task_id={task_id} after {self.max_retries + 1} attempts")
+        return False
@@ -0,0 +1,252 @@
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from typing import Any
+
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_ollama import ChatOllama
+from pydantic import Field
+"""
+Record/replay harness for the agent's external traffic (Ollama and the MCP tools), so the
+A2A/LangGraph overhead can be profiled offline and latency regressions reproduced.
+
+A cassette is a JSON-lines file (gzip-compressed when the name ends in .gz):
+    {"type": "tools", "tools": [{"name", "description", "args_schema"}, ...]}
+    {"type": "query", "text": ...}
+    {"type": "llm", "parts": [[ms_since_previous_part, <raw ollama stream part>], ...]}
+    {"type": "tool", "name": ..., "args": {...}, "ms": ..., "result": ...}
+
+LLM calls replay in recorded order; tool results are matched by name and arguments.
+
+    AGENT_CASSETTE=run.jsonl.gz AGENT_CASSETTE_MODE=record python src/a2a_1_starlette.py
+    python src/record_replay.py run.jsonl.gz           # replay at recorded speed
+    python src/record_replay.py run.jsonl.gz --fast    # replay with no delays
+"""
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "replay-fast")
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {MODES}")
+        self.path = path
+        self.mode = mode
+        self.realtime = mode == "replay"
+        self.tool_specs: list[dict] = []
+        self.queries: list[str] = []
+        self._llm_calls: deque[list] = deque()
+        self._tool_results: dict[str, deque[dict]] = defaultdict(deque)
+        if self.replaying:
+            self._load()
+        else:
+            self._open("wt").close()  # start a fresh recording
+
+    @classmethod
+    def from_env(cls) -> "Cassette | None":
+        """Cassette configured by AGENT_CASSETTE / AGENT_CASSETTE_MODE, if any."""
+        path = os.environ.get("AGENT_CASSETTE")
+        if not path:
+            return None
+        return cls(path, os.environ.get("AGENT_CASSETTE_MODE", "replay"))
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode != "record"
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _load(self) -> None:
+        with self._open("rt") as f:
+            for line in f:
+                entry = json.loads(line)
+                kind = entry["type"]
+                if kind == "tools":
+                    self.tool_specs = entry["tools"]
+                elif kind == "query":
+                    self.queries.append(entry["text"])
+                elif kind == "llm":
+                    self._llm_calls.append(entry["parts"])
+                elif kind == "tool":
+                    self._tool_results[_tool_key(entry["name"], entry["args"])].append(entry)
+
+    def _write(self, entry: dict) -> None:
+        # one append (one gzip member) per entry keeps the file readable while the server
+        # is still recording, and after it is killed
+        with self._open("at") as f:
+            f.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+
+    async def _delay(self, ms: float) -> None:
+        if self.realtime and ms > 0:
+            await asyncio.sleep(ms / 1000)
+
+    def record_query(self, text: str) -> None:
+        if not self.replaying:
+            self._write({"type": "query", "text": text})
+
+    # --- LLM traffic -------------------------------------------------------------------
+
+    def _next_llm_call(self) -> list:
+        if not self._llm_calls:
+            raise RuntimeError(f"Cassette {self.path} has no more recorded LLM calls")
+        return self._llm_calls.popleft()
+
+    async def areplay_llm(self):
+        for ms, part in self._next_llm_call():
+            await self._delay(ms)
+            yield part
+
+    def replay_llm(self):
+        for ms, part in self._next_llm_call():
+            if self.realtime and ms > 0:
+                time.sleep(ms / 1000)
+            yield part
+
+    async def arecord_llm(self, stream):
+        parts = []
+        last = time.perf_counter()
+        async for part in stream:
+            now = time.perf_counter()
+            parts.append([round((now - last) * 1000, 2), _dump_part(part)])
+            last = now
+            yield part
+        self._write({"type": "llm", "parts": parts})
+
+    def record_llm(self, stream):
+        parts = []
+        last = time.perf_counter()
+        for part in stream:
+            now = time.perf_counter()
+            parts.append([round((now - last) * 1000, 2), _dump_part(part)])
+            last = now
+            yield part
+        self._write({"type": "llm", "parts": parts})
+
+    # --- tool traffic ------------------------------------------------------------------
+
+    def record_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Record the tool definitions and wrap each tool so its results are recorded."""
+        self.tool_specs = [
+            {"name": t.name, "description": t.description, "args_schema": _schema_of(t)} for t in tools
+        ]
+        self._write({"type": "tools", "tools": self.tool_specs})
+        return [self._recording_tool(t) for t in tools]
+
+    def _recording_tool(self, tool: BaseTool) -> BaseTool:
+        async def call_tool(**arguments):
+            start = time.perf_counter()
+            # no callbacks, so recording does not add a nested tool run to the event stream
+            result = await tool.ainvoke(arguments, config={"callbacks": []})
+            ms = round((time.perf_counter() - start) * 1000, 2)
+            self._write({"type": "tool", "name": tool.name, "args": arguments, "ms": ms, "result": result})
+            return result
+
+        return StructuredTool(
+            name=tool.name, description=tool.description, args_schema=tool.args_schema, coroutine=call_tool
+        )
+
+    def replay_tools(self) -> list[BaseTool]:
+        """Stand-ins for the recorded MCP tools that answer from the cassette."""
+        return [self._replaying_tool(spec) for spec in self.tool_specs]
+
+    def _replaying_tool(self, spec: dict) -> BaseTool:
+        name = spec["name"]
+
+        async def call_tool(**arguments):
+            recorded = self._tool_results.get(_tool_key(name, arguments))
+            if not recorded:
+                raise RuntimeError(f"Cassette {self.path} has no recorded result for {name}({arguments})")
+            entry = recorded.popleft()
+            await self._delay(entry["ms"])
+            return entry["result"]
+
+        return StructuredTool(
+            name=name, description=spec["description"], args_schema=spec["args_schema"], coroutine=call_tool
+        )
+
+
+class CassetteChatOllama(ChatOllama):
+    """ChatOllama that records its raw Ollama stream to, or replays it from, a cassette.
+
+    Only the network call is swapped, so message conversion, tool binding and structured
+    output still go through ChatOllama's own code.
+    """
+
+    cassette: Any = Field(default=None, exclude=True)
+
+    async def _acreate_chat_stream(self, messages, stop=None, **kwargs):
+        if self.cassette.replaying:
+            stream = self.cassette.areplay_llm()
+        else:
+            stream = self.cassette.arecord_llm(super()._acreate_chat_stream(messages, stop, **kwargs))
+        async for part in stream:
+            yield part
+
+    def _create_chat_stream(self, messages, stop=None, **kwargs):
+        if self.cassette.replaying:
+            yield from self.cassette.replay_llm()
+        else:
+            yield from self.cassette.record_llm(super()._create_chat_stream(messages, stop, **kwargs))
+
+
+def _tool_key(name: str, arguments: dict) -> str:
+    return name + json.dumps(arguments, sort_keys=True, default=str)
+
+
+def _dump_part(part) -> Any:
+    # ollama yields pydantic ChatResponse objects; store only the fields that are set
+    if hasattr(part, "model_dump"):
+        return part.model_dump(mode="json", exclude_none=True)
+    return part
+
+
+def _schema_of(tool: BaseTool) -> dict:
+    schema = tool.args_schema
+    if isinstance(schema, dict):
+        return schema
+    return schema.model_json_schema() if schema is not None else {"type": "object", "properties": {}}
+
+
+async def replay_run(path: str, fast: bool) -> None:
+    """Drive the recorded queries through langG_agent.stream and report latency."""
+    from a2a_3_agent import langG_agent
+
+    cassette = Cassette(path, "replay-fast" if fast else "replay")
+    if not cassette.queries:
+        print(f"❌ {path} has no recorded queries")
+        return
+    agent = langG_agent(cassette=cassette)
+    # one conversation, like the recorded session
+    for i, query in enumerate(cassette.queries):
+        start = time.perf_counter()
+        first = None
+        items = 0
+        async for item in agent.stream(query, context_id="replay"):
+            first = first or time.perf_counter()
+            items += 1
+        total = time.perf_counter() - start
+        ttft = (first - start) if first else total
+        print(f"⏱️  query {i + 1}: first item {ttft * 1000:.1f} ms, total {total * 1000:.1f} ms, {items} items")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded agent cassette offline")
+    parser.add_argument("cassette")
+    parser.add_argument("--fast", action="store_true", help="ignore recorded timings")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(replay_run(args.cassette, args.fast))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+"""
+Import-time profile of the two server entry points. Each module is imported in a fresh
+interpreter with `python -X importtime` (so nothing is cached between runs). The imports
+the module makes itself are grouped by top-level package and printed slowest first.
+
+    python src/startup_profile.py                      # both entry points
+    python src/startup_profile.py a2a_3_agent --top 25  # any module in src/
+"""
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINTS = ["a2a_1_starlette", "mcp_server"]
+
+
+def profile_import(module: str) -> tuple[float, list[tuple[int, str]]]:
+    """Import `module` in a subprocess; return wall time (s) and the import time (us) of each
+    top-level package it imports directly."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    # lines look like: "import time:       312 |       1520 |   langchain_core"; each nesting
+    # level adds two spaces, and a module is printed *after* everything it imported. So the
+    # direct children of `module` are the depth-1 lines right before its own depth-0 line.
+    children: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        if depth == 0:
+            if name.strip() == module:
+                break
+            children = []  # site, encodings, ... imported by the interpreter itself
+        elif depth == 1:
+            children.append((int(cumulative), name.strip()))
+
+    # siblings never overlap, so their cumulative times add up per top-level package
+    totals: dict[str, int] = {}
+    for cumulative, name in children:
+        top = name.split(".")[0]
+        totals[top] = totals.get(top, 0) + cumulative
+    packages = [(cumulative, name) for name, cumulative in totals.items()]
+    packages.sort(reverse=True)
+    return elapsed, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of the agent entry points")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--top", type=int, default=15, help="number of packages to show")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        print("\n" + "=" * 60)
+        try:
+            elapsed, packages = profile_import(module)
+        except RuntimeError as e:
+            print(f"❌ import {module} failed: {e}")
+            continue
+        print(f"⏱️  import {module}: {elapsed:.2f}s wall")
+        print("=" * 60)
+        for cumulative, name in packages[: args.top]:
+            print(f"{cumulative / 1e6:8.3f}s  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import asyncio
+import contextvars
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+"""
+Speculative tool prefetch. While the LLM is still streaming a tool-call message, the partial
+tool_call_chunks are accumulated; as soon as a call's arguments form a complete JSON object
+the call is started in the background. When LangGraph's tool node then runs the same call
+(same tool name and arguments) it takes the in-flight result instead of starting again.
+Anything that is never claimed is cancelled before the next model step.
+
+The chunks are observed from a callback handler attached to the run, which the chat model
+awaits for every token, so a call is always started before the model step (and therefore
+the tool node) can finish. How much latency this hides depends on how early the provider
+streams tool calls: Ollama sends each call whole in the last chunk, so there it saves
+little more than the graph's hand-off from model to tool node.
+"""
+
+logger = logging.getLogger(__name__)
+
+# set by langG_agent.stream for the duration of one run, read by the wrapped tools
+current_prefetcher: ContextVar["ToolPrefetcher | None"] = ContextVar("current_prefetcher", default=None)
+
+
+class ToolPrefetcher:
+    def __init__(self, tools: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]]):
+        self.tools = tools
+        self._partial: dict[tuple[str, Any], dict[str, str]] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+        self._claimed: set[str] = set()  # calls the tool node has run; never start these again
+        self.hits = 0
+        self.wasted = 0
+
+    @staticmethod
+    def _key(name: str, arguments: dict[str, Any]) -> str:
+        return name + json.dumps(arguments, sort_keys=True, default=str)
+
+    def observe(self, run_id: str, chunk) -> None:
+        """Feed one on_chat_model_stream chunk; starts calls whose arguments are complete."""
+        for tool_chunk in getattr(chunk, "tool_call_chunks", None) or []:
+            # fragments of one call share an index (providers that send whole calls may
+            # leave it unset, so fall back to the call id); name/args arrive as string pieces
+            index = tool_chunk.get("index")
+            slot_key = (run_id, index if index is not None else tool_chunk.get("id"))
+            slot = self._partial.setdefault(slot_key, {"name": "", "args": ""})
+            slot["name"] += tool_chunk.get("name") or ""
+            slot["args"] += tool_chunk.get("args") or ""
+            self._maybe_start(slot["name"], slot["args"])
+
+    def _maybe_start(self, name: str, raw_args: str) -> None:
+        if name not in self.tools or not raw_args:
+            return
+        try:
+            arguments = json.loads(raw_args)
+        except ValueError:
+            return  # still streaming
+        if not isinstance(arguments, dict):
+            return
+        key = self._key(name, arguments)
+        if key not in self._pending and key not in self._claimed:
+            logger.info(f"Prefetching {name}({arguments})")
+            # empty context: the call must not attach itself to the model run as a child,
+            # or it would show up as a second tool run in astream_events
+            self._pending[key] = asyncio.create_task(
+                self.tools[name](arguments), context=contextvars.Context()
+            )
+
+    def take(self, name: str, arguments: dict[str, Any]) -> asyncio.Task | None:
+        """Claim the in-flight call matching this tool call, if one was predicted."""
+        key = self._key(name, arguments)
+        self._claimed.add(key)
+        task = self._pending.pop(key, None)
+        if task is not None:
+            self.hits += 1
+        return task
+
+    def discard(self) -> None:
+        """Drop mispredicted calls and partial state (call between model steps)."""
+        for task in self._pending.values():
+            task.cancel()
+            # a prefetch that already failed must not surface as "exception never retrieved"
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self.wasted += len(self._pending)
+        self._pending.clear()
+        self._partial.clear()
+
+
+class PrefetchCallbackHandler(AsyncCallbackHandler):
+    """Feeds streamed chunks to a ToolPrefetcher from inside the model run."""
+
+    run_inline = True
+
+    def __init__(self, prefetcher: ToolPrefetcher):
+        self.prefetcher = prefetcher
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any) -> None:
+        # a new model step: the previous step's tool calls have all run by now
+        self.prefetcher.discard()
+
+    async def on_llm_new_token(self, token: str, *, chunk=None, run_id: UUID, **kwargs: Any) -> None:
+        # ChatOllama also reports bare tokens without a chunk; only chunks carry tool calls
+        if chunk is not None:
+            self.prefetcher.observe(str(run_id), chunk.message)
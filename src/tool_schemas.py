@@ -0,0 +1,96 @@
+import logging
+from pydantic import BaseModel, ValidationError
+"""
+Typed tool results shared by mcp_server.py and the agent. The MCP tools return these models,
+so FastMCP publishes an output schema and sends them as structured content (plus the same
+JSON as text for older clients). The agent parses them back and renders markdown only once,
+right before the result is handed to the LLM.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class WebResult(BaseModel):
+    """One DuckDuckGo hit."""
+    title: str
+    snippet: str
+    url: str
+
+
+class WebSearchResults(BaseModel):
+    query: str
+    results: list[WebResult] = []
+    error: str | None = None
+
+    def to_text(self) -> str:
+        if self.error:
+            return f"Search error: {self.error}"
+        if not self.results:
+            return "No results found."
+        return "\n".join(f"**{r.title}**\n{r.snippet}\nSource: {r.url}\n" for r in self.results)
+
+
+class Paper(BaseModel):
+    """One arXiv paper; `authors` holds at most the first three names."""
+    title: str
+    authors: list[str]
+    et_al: bool = False
+    published: str
+    summary: str
+    pdf_url: str | None = None
+    entry_id: str
+
+
+class PaperSearchResults(BaseModel):
+    query: str
+    papers: list[Paper] = []
+    error: str | None = None
+
+    def to_text(self) -> str:
+        if self.error:
+            return f"Search error: {self.error}"
+        if not self.papers:
+            return "No papers found."
+        return "\n---\n".join(
+            f"**{p.title}**\n"
+            f"Authors: {', '.join(p.authors)}{' et al.' if p.et_al else ''}\n"
+            f"Published: {p.published}\n"
+            f"Summary: {p.summary}...\n"
+            f"PDF: {p.pdf_url}\n"
+            f"arXiv ID: {p.entry_id}\n"
+            for p in self.papers
+        )
+
+
+class WikiPage(BaseModel):
+    query: str
+    title: str | None = None
+    summary: str | None = None
+    url: str | None = None
+    error: str | None = None
+
+    def to_text(self) -> str:
+        if self.error:
+            return f"Error: {self.error}"
+        return f"**{self.title}**\n{self.summary}\nSource: {self.url}"
+
+
+# tool name -> result model, used by the agent to decode tool output
+TOOL_RESULT_MODELS: dict[str, type[BaseModel]] = {
+    "duckduckgo_search": WebSearchResults,
+    "arxiv_search": PaperSearchResults,
+    "wikipedia_search": WikiPage,
+}
+
+
+def render_tool_result(tool_name: str, content) -> str:
+    """Turn a structured tool result (JSON text) into the markdown the LLM reads."""
+    model = TOOL_RESULT_MODELS.get(tool_name)
+    if model is None or not isinstance(content, str):
+        return content
+    try:
+        return model.model_validate_json(content).to_text()
+    except ValidationError:
+        # an older server still sending pre-formatted text
+        logger.debug(f"Passing through unstructured result from {tool_name}")
+        return content
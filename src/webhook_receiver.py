@@ -0,0 +1,54 @@
+import argparse
+import logging
+import random
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+"""
+Local stand-in for a client's push-notification webhook. Run it next to the agent server and
+register http://localhost:9999/notify as the pushNotificationConfig url (client.py does this
+when A2A_PUSH_WEBHOOK is set). `--fail-rate` makes it answer 503 at random to exercise the
+sender's retries.
+
+    python src/webhook_receiver.py --fail-rate 0.3
+"""
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def build_app(token: str | None = None, fail_rate: float = 0.0) -> Starlette:
+    received = []
+
+    async def notify(request: Request) -> JSONResponse:
+        if token and request.headers.get("X-A2A-Notification-Token") != token:
+            return JSONResponse({"error": "bad token"}, status_code=401)
+        if random.random() < fail_rate:
+            return JSONResponse({"error": "simulated outage"}, status_code=503)
+        task = await request.json()
+        received.append(task)
+        logger.info(f"📬 task {task['id']}: {task['status']['state']} ({len(received)} received)")
+        return JSONResponse({"ok": True})
+
+    async def notifications(request: Request) -> JSONResponse:
+        return JSONResponse(received)
+
+    return Starlette(routes=[
+        Route("/notify", notify, methods=["POST"]),
+        Route("/notifications", notifications),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local push-notification webhook")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument("--token", help="expected X-A2A-Notification-Token")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+    uvicorn.run(build_app(args.token, args.fail_rate), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()